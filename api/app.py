@@ -31,7 +31,7 @@ from mcp_clients.notion_client import NotionClient
 from processors.claude_processor import ClaudeProcessor
 from gcp.firestore_client import FirestoreClient
 from gcp.secret_manager import SecretManagerClient
-from notifications import send_error_email, send_success_email, send_welcome_email
+from notifications import EmailSender, send_error_email, send_success_email, send_welcome_email
 
 # Configure logging
 logging.basicConfig(
@@ -193,11 +193,12 @@ def filter_my_todos(todos: list, user_name: str) -> list:
     return filtered
 
 
-def process_aggregation(request: RunRequest) -> dict:
+def process_aggregation(request: RunRequest, sender: Optional[EmailSender] = None) -> dict:
     """Background task to run the todo aggregation.
 
     Args:
         request: User credentials and configuration
+        sender: Optional open EmailSender shared across a batch run
 
     Returns:
         Dict with stats: created, completed, slack_count, gmail_count
@@ -344,6 +345,7 @@ def process_aggregation(request: RunRequest) -> dict:
                 completed=stats["completed"],
                 slack_count=slack_count,
                 gmail_count=gmail_count,
+                sender=sender,
             )
 
         return {
@@ -356,15 +358,16 @@ def process_aggregation(request: RunRequest) -> dict:
     except Exception as e:
         logger.exception(f"Run failed for {request.user_name}: {e}")
         if request.user_email:
-            send_error_email(request.user_email, request.user_name, str(e))
+            send_error_email(request.user_email, request.user_name, str(e), sender=sender)
         raise  # Re-raise for status tracking
 
 
-def process_user_from_firestore(user: dict) -> dict:
+def process_user_from_firestore(user: dict, sender: Optional[EmailSender] = None) -> dict:
     """Process a single user using credentials from Firestore/Secret Manager.
 
     Args:
         user: User document from Firestore
+        sender: Optional open EmailSender shared across a batch run
 
     Returns:
         Dict with status and stats
@@ -395,7 +398,7 @@ def process_user_from_firestore(user: dict) -> dict:
         )
 
         # Run aggregation (synchronously for now)
-        process_aggregation(request)
+        process_aggregation(request, sender=sender)
 
         # Update status on success
         firestore.update_run_status(user_id, "success")
@@ -412,7 +415,7 @@ def process_user_from_firestore(user: dict) -> dict:
 
         # Send error email
         if user.get("email"):
-            send_error_email(user["email"], user_name, error_msg)
+            send_error_email(user["email"], user_name, error_msg, sender=sender)
 
         return {"user_id": user_id, "status": "error", "error": error_msg}
 
@@ -430,14 +433,18 @@ def process_all_users() -> dict:
 
     results = {"success": 0, "error": 0, "users": []}
 
-    for user in users:
-        result = process_user_from_firestore(user)
-        results["users"].append(result)
+    # Each user's aggregation takes minutes, longer than SMTP servers keep an
+    # idle connection open, so emails are queued and sent together at the end
+    # over one connection (one TLS handshake + login for the whole batch)
+    with EmailSender(deferred=True) as sender:
+        for user in users:
+            result = process_user_from_firestore(user, sender=sender)
+            results["users"].append(result)
 
-        if result["status"] == "success":
-            results["success"] += 1
-        else:
-            results["error"] += 1
+            if result["status"] == "success":
+                results["success"] += 1
+            else:
+                results["error"] += 1
 
     logger.info(f"Batch processing complete: {results['success']} success, {results['error']} errors")
     return results
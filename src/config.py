@@ -23,6 +23,9 @@ class Config:
     SLACK_USER_TOKEN: str = os.getenv("SLACK_USER_TOKEN", "")  # User OAuth Token (xoxp-...)
     SLACK_BOT_TOKEN: str = os.getenv("SLACK_BOT_TOKEN", "")  # Legacy, kept for compatibility
     SLACK_CANVAS_ID: str = os.getenv("SLACK_CANVAS_ID", "")
+    SLACK_LIST_PAGE_SIZE: int = int(os.getenv("SLACK_LIST_PAGE_SIZE", "100"))  # conversations.list page size
+    SLACK_CACHE_DIR: str = os.getenv("SLACK_CACHE_DIR") or os.path.expanduser("~/.cache/todo-aggregator")  # On-disk user/workspace cache
+    SLACK_ACTION_HINT_RE: str = os.getenv("SLACK_ACTION_HINT_RE", "")  # Optional: only keep Slack messages matching this regex
 
     # Zoom
     ZOOM_ACCOUNT_ID: str = os.getenv("ZOOM_ACCOUNT_ID", "")
@@ -144,7 +144,7 @@ class GmailClient:
                 lines = [line.strip() for line in text.splitlines()]
                 return '\n'.join(line for line in lines if line)
             except Exception as e:
-                logger.debug(f"BeautifulSoup parsing failed, using regex fallback: {e}")
+                logger.debug("BeautifulSoup parsing failed, using regex fallback: %s", e)
 
         # Fallback: regex-based HTML stripping
         # Remove script/style content
@@ -346,7 +346,7 @@ class GmailClient:
 
         try:
             query = self._build_query(days)
-            logger.debug(f"Gmail query: {query}")
+            logger.debug("Gmail query: %s", query)
 
             # List messages matching query
             results = service.users().messages().list(
@@ -419,7 +419,7 @@ class GmailClient:
                     })
 
                     if is_zoom_email:
-                        logger.debug(f"Detected Zoom thread (re-attributed): {subject}")
+                        logger.debug("Detected Zoom thread (re-attributed): %s", subject)
 
                 except HttpError as e:
                     logger.warning(f"Error fetching thread {thread_id}: {e}")
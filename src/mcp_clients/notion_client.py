@@ -68,11 +68,11 @@ class NotionClient:
                 todo = self._parse_page(page)
                 todos.append(todo)
 
-            logger.info(f"Retrieved {len(todos)} todos from Notion")
+            logger.info("Retrieved %s todos from Notion", len(todos))
             return todos
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error querying Notion database: {e}")
+            logger.error("Error querying Notion database: %s", e)
             raise
 
     def create_page(self, todo: Dict[str, Any]) -> Dict[str, Any]:
@@ -95,13 +95,13 @@ class NotionClient:
             response.raise_for_status()
             data = response.json()
 
-            logger.info(f"Created todo in Notion: {todo.get('task', 'Untitled')}")
+            logger.info("Created todo in Notion: %s", todo.get('task', 'Untitled'))
             return data
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error creating Notion page: {e}")
+            logger.error("Error creating Notion page: %s", e)
             if hasattr(response, 'text'):
-                logger.error(f"Response: {response.text}")
+                logger.error("Response: %s", response.text)
             raise
 
     def update_page(self, page_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -125,11 +125,11 @@ class NotionClient:
             response.raise_for_status()
             data = response.json()
 
-            logger.info(f"Updated todo in Notion: {page_id}")
+            logger.info("Updated todo in Notion: %s", page_id)
             return data
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error updating Notion page: {e}")
+            logger.error("Error updating Notion page: %s", e)
             raise
 
     def add_comment(self, page_id: str, comment_text: str) -> Dict[str, Any]:
@@ -155,11 +155,11 @@ class NotionClient:
             response.raise_for_status()
             data = response.json()
 
-            logger.debug(f"Added comment to Notion page: {page_id}")
+            logger.debug("Added comment to Notion page: %s", page_id)
             return data
 
         except requests.exceptions.RequestException as e:
-            logger.warning(f"Error adding comment to Notion page {page_id}: {e}")
+            logger.warning("Error adding comment to Notion page %s: %s", page_id, e)
             # Don't raise - comments are nice-to-have, not critical
             return {}
 
@@ -374,11 +374,11 @@ class NotionClient:
                 if meeting:
                     meetings.append(meeting)
 
-            logger.info(f"Retrieved {len(meetings)} meeting notes from Notion")
+            logger.info("Retrieved %s meeting notes from Notion", len(meetings))
             return meetings
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error querying Notion meetings database: {e}")
+            logger.error("Error querying Notion meetings database: %s", e)
             return []
 
     def _parse_meeting_page(self, page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -407,7 +407,7 @@ class NotionClient:
         # Fetch page content (blocks)
         content = self._get_page_content(page_id)
         if not content.strip():
-            logger.debug(f"Skipping empty meeting page: {title or page_id}")
+            logger.debug("Skipping empty meeting page: %s", title or page_id)
             return None
 
         # Format for Claude processing
@@ -473,7 +473,7 @@ class NotionClient:
             return "\n".join(content_parts)
 
         except requests.exceptions.RequestException as e:
-            logger.debug(f"Could not fetch block content (may be unsupported block type): {e}")
+            logger.debug("Could not fetch block content (may be unsupported block type): %s", e)
             return ""
 
     def _extract_block_text(self, block: Dict[str, Any]) -> str:
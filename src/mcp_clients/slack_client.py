@@ -1,18 +1,185 @@
 """Slack API client for fetching conversation messages."""
 
+import atexit
+import hashlib
+import json
 import logging
+import os
+import random
+import re
+import tempfile
+import threading
 import time
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Clients whose caches still need saving when the interpreter exits
+_live_clients: "weakref.WeakSet[SlackClient]" = weakref.WeakSet()
+
+
+@atexit.register
+def _save_live_client_caches() -> None:
+    """Persist every live client's disk cache at exit (no-op when unchanged)."""
+    for client in list(_live_clients):
+        client.save_disk_cache()
+
+
+# auth.test responses shared by every client in the process, keyed by token
+# hash: token_key -> (fetched_at, data). See SlackClient.AUTH_CACHE_TTL_SECONDS.
+_auth_test_cache: Dict[str, tuple] = {}
+
+# Message subtypes that carry human-written content. Messages with any other
+# subtype are system events (joins, renames, pins, bot_add, huddle_thread,
+# channel_convert_to_private, ...) and are skipped; an allow-list keeps new
+# event types Slack adds from leaking into todo extraction.
+_CONTENT_SUBTYPES = frozenset({"thread_broadcast", "me_message", "file_share"})
+
+
+class _AimdLimiter:
+    """
+    Concurrency limit that adapts like TCP congestion control (AIMD).
+
+    Every successful request raises the limit additively; a throttled one
+    (429 or 5xx) cuts it multiplicatively. acquire() blocks while the number
+    of requests in flight has reached the current limit.
+    """
+
+    def __init__(
+        self, initial: int, minimum: int, maximum: int, increase: float = 0.5, decrease: float = 0.5
+    ):
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._increase = increase
+        self._decrease = decrease
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        """Wait for a free slot under the current limit and take it."""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self) -> None:
+        """Give back a slot taken by acquire()."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def record(self, throttled: bool) -> None:
+        """
+        Adjust the limit after a request.
+
+        Args:
+            throttled: Whether Slack pushed back (rate limit or server error)
+        """
+        with self._cond:
+            if throttled:
+                self._limit = max(self._minimum, self._limit * self._decrease)
+            else:
+                self._limit = min(self._maximum, self._limit + self._increase)
+            self._cond.notify_all()
+
+
+@lru_cache(maxsize=4096)
+def _fmt_minute(minute_epoch: int) -> str:
+    """Format a Unix timestamp bucketed to the minute as 'YYYY-MM-DD HH:MM' (memoized)."""
+    # localtime + integer formatting skips the datetime allocation and strftime
+    lt = time.localtime(minute_epoch * 60)
+    return f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d} {lt.tm_hour:02d}:{lt.tm_min:02d}"
+
 
 class SlackClient:
     """Client for interacting with Slack API to fetch conversation messages."""
 
+    # Sliding-window budgets (calls, seconds) per method from Slack's published
+    # tiers, so large workspaces stay under them instead of hitting 429s.
+    # Requests only wait once a method's window is actually full.
+    RATE_LIMITS = {
+        "conversations.history": (50, 60),  # Tier 3
+        "conversations.replies": (50, 60),  # Tier 3
+        "conversations.list": (20, 60),  # Tier 2
+        "conversations.info": (50, 60),  # Tier 3
+        "search.messages": (20, 60),  # Tier 2
+        "users.list": (20, 60),  # Tier 2
+        "users.info": (100, 60),  # Tier 4
+    }
+
+    # Concurrent conversations fetched at once during a full scan, and
+    # concurrent thread reply fetches per conversation (every active thread
+    # is fetched; the conversations.replies window does the rate limiting)
+    MAX_WORKERS = 6
+    THREAD_REPLY_WORKERS = 3
+
+    # Concurrent channel fetches on the search path, kept to Slack's
+    # recommended 3 for Tier-3 methods
+    SEARCH_CHANNEL_WORKERS = 3
+
+    # Safety cap on search.messages pages per query (100 matches per page)
+    MAX_SEARCH_PAGES = 20
+
+    # Requests in flight across the nested conversation and thread pools are
+    # limited adaptively (AIMD): start low, grow while Slack keeps up, halve on
+    # 429/5xx. The cap is also the connection pool size so no connection is
+    # ever discarded.
+    MAX_IN_FLIGHT_REQUESTS = 16
+    INITIAL_IN_FLIGHT_REQUESTS = 4
+
+    # conversations.history page size. History is read without 'oldest' and
+    # paging stops at the first page reaching past the window, so that page
+    # also holds older thread parents that may have new replies: at least the
+    # latest HISTORY_PAGE_SIZE messages are always scanned, in one request for
+    # quiet channels.
+    HISTORY_PAGE_SIZE = 100
+
+    # Clients created in the same process (e.g. one per triggered run in the
+    # API server) reuse a token's auth.test result for this long
+    AUTH_CACHE_TTL_SECONDS = 60 * 60
+
+    # How long user names and workspace metadata persisted on disk stay valid.
+    # Display names change occasionally; the workspace domain and own ID rarely do.
+    USER_CACHE_TTL_SECONDS = 24 * 60 * 60
+    META_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+    CACHE_FILENAME = "slack_users.json"
+
+    # Upper bound on in-memory user names; least recently used names are
+    # evicted first so long-running processes don't grow without limit
+    USER_CACHE_MAX_ENTRIES = 50000
+
+    # The conversation list is reused across runs for a short while; fields
+    # that change with every message are dropped so stale activity data is
+    # never trusted (see _is_dormant)
+    CHANNEL_CACHE_TTL_SECONDS = 60 * 60
+    CHANNEL_CACHE_FILENAME = "slack_channels.json"
+    VOLATILE_CONVERSATION_FIELDS = ("latest", "updated", "last_read", "unread_count")
+
+    # Conversation types listed by get_all_conversations, one request chain each
+    CONVERSATION_TYPES = ("public_channel", "private_channel", "mpim", "im")
+
     def __init__(self, token: Optional[str] = None):
         """Initialize Slack client with User OAuth token.
 
@@ -22,9 +189,236 @@ class SlackClient:
         """
         self.user_token = token or Config.SLACK_USER_TOKEN
         self.base_url = "https://slack.com/api"
-        self.user_cache: Dict[str, str] = {}  # Cache user ID -> display name
+        self.user_cache: "OrderedDict[str, str]" = OrderedDict()  # LRU user ID -> display name
         self._workspace_name: Optional[str] = None  # Cache workspace name
+        self._archive_url_prefix: Optional[str] = None  # Permalink prefix, set once the workspace is known
         self._my_user_id: Optional[str] = None  # Cache authenticated user's ID
+        self._auth_test_data: Optional[Dict[str, Any]] = None  # Cached auth.test response
+        self._auth_lock = threading.Lock()  # Worker threads may all need auth.test at once
+        self._call_windows: Dict[str, deque] = {}  # Method -> recent request start times
+        self._rate_lock = threading.Lock()  # Shared by worker threads pacing requests
+        self._concurrency = _AimdLimiter(
+            initial=self.INITIAL_IN_FLIGHT_REQUESTS,
+            minimum=1,
+            maximum=self.MAX_IN_FLIGHT_REQUESTS,
+        )
+        self._user_cache_primed = False  # Whether users.list has been loaded
+        self._prime_lock = threading.Lock()
+
+        # Optional prefilter: only messages matching the action-hint regex are
+        # turned into content (see Config.SLACK_ACTION_HINT_RE)
+        self._action_hint = None
+        if Config.SLACK_ACTION_HINT_RE:
+            try:
+                self._action_hint = re.compile(Config.SLACK_ACTION_HINT_RE, re.IGNORECASE).search
+            except re.error as e:
+                logger.error(f"Invalid SLACK_ACTION_HINT_RE, not filtering messages: {e}")
+
+        # Warm the caches from previous runs so repeat invocations skip the API
+        self._cache_path = os.path.join(Config.SLACK_CACHE_DIR, self.CACHE_FILENAME)
+        self._channel_cache_path = os.path.join(Config.SLACK_CACHE_DIR, self.CHANNEL_CACHE_FILENAME)
+        self._token_key = hashlib.sha256(self.user_token.encode()).hexdigest()[:16]
+        self._load_disk_cache()
+        _live_clients.add(self)
+
+        # Reuse one pooled connection to slack.com instead of a new TLS handshake per call
+        self._session = requests.Session()
+        self._session.headers.update({"Authorization": f"Bearer {self.user_token}"})
+        # All HTTP-level retrying (429 with Retry-After, transient 5xx with
+        # exponential backoff) happens here rather than in _make_request
+        retry = Retry(
+            total=5,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False,  # Hand the final response back to _make_request
+        )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.MAX_IN_FLIGHT_REQUESTS,
+                max_retries=retry,
+            ),
+        )
+
+    def _read_disk_cache(self) -> Dict[str, Any]:
+        """
+        Read the on-disk cache file, dropping entries older than the TTL.
+
+        User names are stored per token (token_key -> user ID -> entry) so
+        tenants sharing the file never see each other's directories.
+
+        Returns:
+            Dict with "users" and "workspaces" maps (empty if missing or unreadable)
+        """
+        try:
+            with open(self._cache_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {"users": {}, "workspaces": {}}
+
+        now = time.time()
+        users = {}
+        for token_key, entries in data.get("users", {}).items():
+            # Entries from the older shared (unkeyed) layout can't be attributed
+            # to a workspace, so they are dropped
+            if not isinstance(entries, dict) or "name" in entries:
+                continue
+            fresh = {
+                user_id: entry for user_id, entry in entries.items()
+                if entry.get("mtime", 0) >= now - self.USER_CACHE_TTL_SECONDS
+            }
+            if fresh:
+                users[token_key] = fresh
+
+        workspaces = {
+            key: entry for key, entry in data.get("workspaces", {}).items()
+            if entry.get("mtime", 0) >= now - self.META_CACHE_TTL_SECONDS
+        }
+        return {"users": users, "workspaces": workspaces}
+
+    def _load_disk_cache(self) -> None:
+        """Populate user_cache and workspace metadata from the on-disk cache."""
+        data = self._read_disk_cache()
+
+        for user_id, entry in data["users"].get(self._token_key, {}).items():
+            self._remember_user(user_id, entry["name"])
+
+        workspace = data["workspaces"].get(self._token_key, {})
+        self._workspace_name = workspace.get("workspace_name")
+        self._my_user_id = workspace.get("my_user_id")
+
+        if self.user_cache:
+            logger.debug("Loaded %s cached Slack users from %s", len(self.user_cache), self._cache_path)
+
+    def save_disk_cache(self) -> None:
+        """
+        Persist user_cache and workspace metadata for the next run.
+
+        Merges with whatever is already on disk (other tokens may share the file)
+        and writes atomically via a temp file + os.replace. Skips the write
+        entirely when nothing new was learned. Unchanged entries keep their
+        original timestamp so they still expire on schedule.
+        """
+        now = time.time()
+        data = self._read_disk_cache()
+        dirty = False
+
+        users = data["users"].setdefault(self._token_key, {})
+        for user_id, name in list(self.user_cache.items()):
+            # Failed lookups are cached as the raw ID; don't persist those
+            if name != user_id and users.get(user_id, {}).get("name") != name:
+                users[user_id] = {"name": name, "mtime": now}
+                dirty = True
+
+        meta = {"workspace_name": self._workspace_name, "my_user_id": self._my_user_id}
+        cached_meta = data["workspaces"].get(self._token_key, {})
+        if (self._workspace_name or self._my_user_id) and any(
+            value and cached_meta.get(key) != value for key, value in meta.items()
+        ):
+            data["workspaces"][self._token_key] = {**cached_meta, **meta, "mtime": now}
+            dirty = True
+
+        if dirty:
+            self._write_cache_file(self._cache_path, data)
+
+    @staticmethod
+    def _write_cache_file(path: str, data: Dict[str, Any]) -> None:
+        """
+        Atomically write a JSON cache file via a temp file + os.replace.
+
+        Args:
+            path: Destination file path
+            data: JSON-serializable data to write
+        """
+        try:
+            cache_dir = os.path.dirname(path)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write Slack cache to {path}: {e}")
+
+    def _load_cached_conversations(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get this token's conversation list from disk if it is still fresh.
+
+        Returns:
+            List of conversation objects, or None on a miss or expired entry
+        """
+        try:
+            with open(self._channel_cache_path) as f:
+                entry = json.load(f).get(self._token_key, {})
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("mtime", 0) < time.time() - self.CHANNEL_CACHE_TTL_SECONDS:
+            return None
+        return entry.get("channels")
+
+    def _save_cached_conversations(self, conversations: List[Dict[str, Any]]) -> None:
+        """
+        Persist this token's conversation list without per-message fields.
+
+        Args:
+            conversations: Conversation objects from conversations.list
+        """
+        try:
+            with open(self._channel_cache_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+
+        data[self._token_key] = {
+            "mtime": time.time(),
+            "channels": [
+                {k: v for k, v in conv.items() if k not in self.VOLATILE_CONVERSATION_FIELDS}
+                for conv in conversations
+            ],
+        }
+        self._write_cache_file(self._channel_cache_path, data)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "SlackClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _auth_test(self) -> Dict[str, Any]:
+        """
+        Call auth.test once and reuse the response for user, team and domain.
+
+        The response is also shared with other clients using the same token
+        for AUTH_CACHE_TTL_SECONDS.
+
+        Returns:
+            The auth.test response data
+
+        Raises:
+            Exception if the request fails (failures are not cached)
+        """
+        if self._auth_test_data is None:
+            with self._auth_lock:
+                if self._auth_test_data is None:
+                    cached = _auth_test_cache.get(self._token_key)
+                    if cached and time.time() - cached[0] < self.AUTH_CACHE_TTL_SECONDS:
+                        self._auth_test_data = cached[1]
+                    else:
+                        self._auth_test_data = self._make_request("auth.test")
+                        _auth_test_cache[self._token_key] = (time.time(), self._auth_test_data)
+        return self._auth_test_data
 
     def _get_my_user_id(self) -> str:
         """
@@ -37,9 +431,9 @@ class SlackClient:
             return self._my_user_id
 
         try:
-            data = self._make_request("auth.test")
+            data = self._auth_test()
             self._my_user_id = data.get("user_id")
-            logger.debug(f"Authenticated Slack user ID: {self._my_user_id}")
+            logger.debug("Authenticated Slack user ID: %s", self._my_user_id)
             return self._my_user_id
         except Exception as e:
             logger.warning(f"Could not get authenticated user ID: {e}")
@@ -56,19 +450,31 @@ class SlackClient:
             return self._workspace_name
 
         try:
-            data = self._make_request("auth.test")
+            data = self._auth_test()
             # Use team_domain (URL-safe slug) instead of team (display name with spaces)
             team_domain = data.get("team_domain")
             team_name = data.get("team", "workspace")
-            logger.debug(f"Slack auth.test response: team_domain={team_domain}, team={team_name}")
+            logger.debug("Slack auth.test response: team_domain=%s, team=%s", team_domain, team_name)
             # Fallback: remove spaces (don't add hyphens) and lowercase
             self._workspace_name = team_domain or team_name.replace(" ", "").lower()
             logger.info(f"Using Slack workspace domain: {self._workspace_name}")
             return self._workspace_name
         except Exception as e:
-            logger.debug(f"Could not get workspace name: {e}")
+            logger.debug("Could not get workspace name: %s", e)
             return "workspace"
 
+    def _url_prefix(self) -> str:
+        """Workspace archive URL prefix, memoized once the workspace is known."""
+        if self._archive_url_prefix:
+            return self._archive_url_prefix
+
+        prefix = f"https://{self.get_workspace_name()}.slack.com/archives/"
+        # The "workspace" placeholder from a failed auth.test isn't cached, so
+        # later messages get the real domain once auth.test succeeds
+        if self._workspace_name:
+            self._archive_url_prefix = prefix
+        return prefix
+
     def _build_message_url(self, channel_id: str, ts: str) -> str:
         """
         Build permalink to Slack message.
@@ -80,12 +486,36 @@ class SlackClient:
         Returns:
             URL to the message in Slack
         """
-        workspace = self.get_workspace_name()
-        ts_no_dot = ts.replace(".", "")
-        return f"https://{workspace}.slack.com/archives/{channel_id}/p{ts_no_dot}"
+        return f"{self._url_prefix()}{channel_id}/p{ts.replace('.', '', 1)}"
+
+    def _wait_for_method_slot(self, method: str) -> None:
+        """
+        Sleep until this API method has room in its sliding rate-limit window.
+
+        Args:
+            method: API method name (e.g., 'conversations.history')
+        """
+        limit = self.RATE_LIMITS.get(method)
+        if not limit:
+            return
+        max_calls, window = limit
+
+        # Reserve the next free slot under the lock so concurrent workers queue up.
+        # Only the last max_calls start times matter: once the window is full,
+        # the next call may start when the oldest of them leaves the window.
+        with self._rate_lock:
+            now = time.monotonic()
+            starts = self._call_windows.setdefault(method, deque(maxlen=max_calls))
+            slot = now
+            if len(starts) == max_calls:
+                slot = max(now, starts[0] + window)
+            starts.append(slot)
+
+        if slot > now:
+            time.sleep(slot - now)
 
     def _make_request(
-        self, method: str, params: Optional[Dict] = None, retries: int = 3
+        self, method: str, params: Optional[Dict] = None, retries: int = 5
     ) -> Dict[str, Any]:
         """
         Make authenticated request to Slack API with rate limiting and retries.
@@ -93,7 +523,7 @@ class SlackClient:
         Args:
             method: API method name (e.g., 'conversations.list')
             params: Optional parameters for the request
-            retries: Number of retries for rate-limited requests
+            retries: Number of retries when Slack reports 'ratelimited' in the body
 
         Returns:
             Response JSON data
@@ -102,55 +532,130 @@ class SlackClient:
             Exception if request fails or Slack returns an error
         """
         url = f"{self.base_url}/{method}"
-        headers = {
-            "Authorization": f"Bearer {self.user_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
 
         for attempt in range(retries + 1):
+            self._wait_for_method_slot(method)
             try:
-                response = requests.get(url, headers=headers, params=params)
-
-                # Handle rate limiting with exponential backoff
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 2))
-                    if attempt < retries:
-                        sleep_time = min(retry_after, 5) * (attempt + 1)
-                        logger.debug(f"Rate limited on {method}, sleeping {sleep_time}s (attempt {attempt + 1})")
-                        time.sleep(sleep_time)
-                        continue
-                    else:
-                        logger.warning(f"Rate limited on {method} after {retries} retries")
-                        raise Exception(f"Rate limited: {method}")
-
+                # 429s and 5xx are retried by the session's urllib3 Retry, which
+                # honors Retry-After; whatever it finally returns is an error here
+                self._concurrency.acquire()
+                try:
+                    response = self._session.get(url, params=params, timeout=30)
+                finally:
+                    self._concurrency.release()
+                self._concurrency.record(throttled=self._was_throttled(response))
                 response.raise_for_status()
-                data = response.json()
-
-                if not data.get("ok", False):
-                    error = data.get("error", "Unknown error")
-                    # Handle rate_limited error in response body
-                    if error == "ratelimited":
-                        if attempt < retries:
-                            sleep_time = 2 * (attempt + 1)
-                            logger.debug(f"Rate limited (body) on {method}, sleeping {sleep_time}s")
-                            time.sleep(sleep_time)
-                            continue
-                    logger.error(f"Slack API error for {method}: {error}")
-                    raise Exception(f"Slack API error: {error}")
-
-                # Small delay between successful requests to avoid hitting limits
-                time.sleep(0.1)
-                return data
-
             except requests.exceptions.RequestException as e:
-                if attempt < retries and "429" in str(e):
-                    time.sleep(2 * (attempt + 1))
-                    continue
                 logger.error(f"Error making Slack API request to {method}: {e}")
                 raise
 
+            # orjson parses the raw bytes directly and is much faster on large pages
+            data = orjson.loads(response.content) if HAS_ORJSON else response.json()
+
+            if not data.get("ok", False):
+                error = data.get("error", "Unknown error")
+                # urllib3 can't see rate limiting reported in the JSON body, so
+                # back off (with jitter) and retry that case here
+                if error == "ratelimited":
+                    self._concurrency.record(throttled=True)
+                if error == "ratelimited" and attempt < retries:
+                    sleep_time = min(2 ** attempt, 30) + random.uniform(0, 0.5)
+                    logger.debug("Rate limited (body) on %s, sleeping %ss", method, sleep_time)
+                    time.sleep(sleep_time)
+                    continue
+                logger.error(f"Slack API error for {method}: {error}")
+                raise Exception(f"Slack API error: {error}")
+
+            return data
+
         raise Exception(f"Max retries exceeded for {method}")
 
+    @staticmethod
+    def _was_throttled(response: requests.Response) -> bool:
+        """
+        Check whether Slack pushed back at any point while serving a response.
+
+        Args:
+            response: Final response, after urllib3's own retries
+
+        Returns:
+            True if the final status or any retried attempt was a 429 or 5xx
+        """
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+        statuses = [attempt.status for attempt in getattr(retries, "history", ())]
+        statuses.append(response.status_code)
+        return any(status and (status == 429 or status >= 500) for status in statuses)
+
+    @staticmethod
+    def _display_name(user: Dict[str, Any], default: str) -> str:
+        """
+        Pick the best human-readable name from a Slack user object.
+
+        Args:
+            user: User object from users.info or users.list
+            default: Value to return if the user has no usable name
+
+        Returns:
+            display_name, falling back to real_name, then name, then default
+        """
+        return (
+            user.get("profile", {}).get("display_name")
+            or user.get("real_name")
+            or user.get("name")
+            or default
+        )
+
+    def _prime_user_cache(self) -> None:
+        """
+        Populate the user cache from users.list in as few requests as possible.
+
+        One paginated users.list call (up to 1000 users per page) replaces a
+        users.info round-trip per unique user. Runs at most once per client.
+        """
+        with self._prime_lock:
+            if self._user_cache_primed:
+                return
+
+            cursor = None
+            count = 0
+            try:
+                while True:
+                    params = {"limit": 1000}
+                    if cursor:
+                        params["cursor"] = cursor
+
+                    data = self._make_request("users.list", params)
+                    for user in data.get("members", []):
+                        user_id = user.get("id")
+                        if user_id:
+                            self._remember_user(user_id, self._display_name(user, user_id))
+                            count += 1
+
+                    cursor = data.get("response_metadata", {}).get("next_cursor")
+                    if not cursor:
+                        break
+
+                logger.debug("Primed Slack user cache with %s users", count)
+            except Exception as e:
+                logger.debug("Could not prime user cache from users.list: %s", e)
+            finally:
+                self._user_cache_primed = True
+
+    def _remember_user(self, user_id: str, name: str) -> None:
+        """
+        Store a display name, evicting the least recently used one when full.
+
+        Args:
+            user_id: Slack user ID
+            name: Display name (or the raw ID for failed lookups)
+        """
+        self.user_cache[user_id] = name
+        if len(self.user_cache) > self.USER_CACHE_MAX_ENTRIES:
+            try:
+                self.user_cache.popitem(last=False)
+            except KeyError:
+                pass  # Another worker emptied it first
+
     def _get_user_name(self, user_id: str) -> str:
         """
         Get display name for a user ID, using cache.
@@ -161,26 +666,59 @@ class SlackClient:
         Returns:
             User's display name or real name, or user_id if lookup fails
         """
-        if user_id in self.user_cache:
-            return self.user_cache[user_id]
+        name = self.user_cache.get(user_id)
+        if name is not None:
+            try:
+                self.user_cache.move_to_end(user_id)
+            except KeyError:
+                pass  # Evicted by another worker in the meantime
+            return name
 
+        # First miss: load the whole directory in bulk, then retry the cache
+        if not self._user_cache_primed:
+            self._prime_user_cache()
+            name = self.user_cache.get(user_id)
+            if name is not None:
+                return name
+
+        # Fall back to a single lookup (e.g. guests added after priming)
         try:
             data = self._make_request("users.info", {"user": user_id})
-            user = data.get("user", {})
-            # Prefer display_name, fall back to real_name, then name
-            name = (
-                user.get("profile", {}).get("display_name")
-                or user.get("real_name")
-                or user.get("name")
-                or user_id
-            )
-            self.user_cache[user_id] = name
+            name = self._display_name(data.get("user", {}), user_id)
+            self._remember_user(user_id, name)
             return name
         except Exception as e:
-            logger.debug(f"Could not get user info for {user_id}: {e}")
-            self.user_cache[user_id] = user_id
+            logger.debug("Could not get user info for %s: %s", user_id, e)
+            self._remember_user(user_id, user_id)
             return user_id
 
+    def _resolve_user_names(self, user_ids: Iterable[Optional[str]]) -> None:
+        """
+        Make sure every message author is in user_cache before formatting.
+
+        Cache misses are filled by the bulk users.list prime first, then any
+        stragglers are looked up concurrently, so formatting loops only read
+        from the cache instead of interleaving HTTP calls.
+
+        Args:
+            user_ids: Author IDs that need display names (None entries are ignored)
+        """
+        # Membership tests only: other workers may be inserting into user_cache,
+        # and iterating a dict while it grows raises RuntimeError
+        user_cache = self.user_cache
+        needed = {user_id for user_id in set(user_ids) if user_id not in user_cache}
+        needed.discard(None)
+        if not needed:
+            return
+
+        if not self._user_cache_primed:
+            self._prime_user_cache()
+            needed = {user_id for user_id in needed if user_id not in user_cache}
+
+        if needed:
+            with ThreadPoolExecutor(max_workers=min(len(needed), self.MAX_WORKERS)) as executor:
+                list(executor.map(self._get_user_name, needed))
+
     def _get_conversation_name(self, conversation: Dict) -> str:
         """
         Get a readable name for a conversation.
@@ -213,6 +751,57 @@ class SlackClient:
 
         return conversation.get("name", "unknown")
 
+    @staticmethod
+    def _may_involve_user(message: Dict[str, Any], user_id: str, oldest_ts: float) -> bool:
+        """
+        Check whether a history message could show the user's recent activity.
+
+        Errs towards True: thread parents with recent replies count when the
+        user may be among the repliers, since reply_users can be truncated.
+
+        Args:
+            message: Message object from conversations.history
+            user_id: Slack user ID to look for
+            oldest_ts: Start of the window as a Unix timestamp
+
+        Returns:
+            True if the user posted it inside the window, or it is a thread the
+            user started or may have replied to with replies inside the window
+        """
+        if message.get("user") == user_id and float(message.get("ts", 0)) >= oldest_ts:
+            return True
+        if float(message.get("latest_reply") or 0) < oldest_ts:
+            return False
+        reply_users = message.get("reply_users", ())
+        return (
+            message.get("user") == user_id
+            or user_id in reply_users
+            or message.get("reply_users_count", 0) > len(reply_users)
+        )
+
+    @staticmethod
+    def _is_human_message(message: Dict[str, Any]) -> bool:
+        """
+        Check whether a message was posted by a person.
+
+        Args:
+            message: Message object from Slack API
+
+        Returns:
+            True for plain messages and content subtypes (see _CONTENT_SUBTYPES),
+            False for system events and bot messages
+        """
+        # History always sets "type"; subscripting avoids a .get() per message
+        try:
+            subtype = message.get("subtype")
+            return (
+                message["type"] == "message"
+                and (subtype is None or subtype in _CONTENT_SUBTYPES)
+                and "bot_id" not in message
+            )
+        except KeyError:
+            return False
+
     def _get_thread_replies(
         self, channel_id: str, thread_ts: str, days: int = 1
     ) -> List[Dict[str, Any]]:
@@ -228,7 +817,7 @@ class SlackClient:
             List of message objects from the thread
         """
         try:
-            oldest = (datetime.now() - timedelta(days=days)).timestamp()
+            oldest = time.time() - days * 86400
             params = {
                 "channel": channel_id,
                 "ts": thread_ts,
@@ -238,33 +827,44 @@ class SlackClient:
             data = self._make_request("conversations.replies", params)
             replies = data.get("messages", [])
             # Filter same as main messages (exclude bot messages and system messages)
-            return [
-                m for m in replies
-                if m.get("type") == "message"
-                and not m.get("subtype")
-                and not m.get("bot_id")
-            ]
+            return [m for m in replies if self._is_human_message(m)]
         except Exception as e:
-            logger.debug(f"Could not fetch thread replies for {thread_ts}: {e}")
+            logger.debug("Could not fetch thread replies for %s: %s", thread_ts, e)
             return []
 
-    def get_all_conversations(self) -> List[Dict[str, Any]]:
+    def _get_conversation_info(self, channel_id: str) -> Optional[Dict[str, Any]]:
         """
-        Get all conversations the user has access to.
+        Fetch a single conversation object via conversations.info.
+
+        Args:
+            channel_id: Slack conversation ID
 
         Returns:
-            List of conversation objects (public, private, DMs, group DMs)
+            Conversation object, or None if it can't be read
+        """
+        try:
+            return self._make_request("conversations.info", {"channel": channel_id}).get("channel")
+        except Exception as e:
+            logger.debug("Could not get info for %s: %s", channel_id, e)
+            return None
+
+    def _list_conversations(self, conversation_type: str) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Page through conversations.list for a single conversation type.
+
+        Args:
+            conversation_type: One Slack conversation type (e.g. "im")
+
+        Returns:
+            Tuple of (conversations, whether every page was fetched)
         """
         conversations = []
         cursor = None
 
-        # Fetch all conversation types
-        types = "public_channel,private_channel,mpim,im"
-
         while True:
             params = {
-                "types": types,
-                "limit": 200,  # Max per page
+                "types": conversation_type,
+                "limit": Config.SLACK_LIST_PAGE_SIZE,  # Smaller pages trip fewer rate limits
                 "exclude_archived": "true",
             }
             if cursor:
@@ -277,17 +877,54 @@ class SlackClient:
                 # Check for pagination
                 cursor = data.get("response_metadata", {}).get("next_cursor")
                 if not cursor:
-                    break
+                    return conversations, True
 
             except Exception as e:
-                logger.error(f"Error fetching conversations: {e}")
-                break
+                logger.error(f"Error fetching {conversation_type} conversations: {e}")
+                return conversations, False
+
+    def get_all_conversations(self, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get all conversations the user has access to.
+
+        Large workspaces need many conversations.list pages, so the list is
+        reused from disk for up to CHANNEL_CACHE_TTL_SECONDS.
+
+        Args:
+            use_cache: Whether a recent on-disk copy may be returned
+
+        Returns:
+            List of conversation objects (public, private, DMs, group DMs)
+        """
+        if use_cache:
+            cached = self._load_cached_conversations()
+            if cached is not None:
+                logger.info(f"Using {len(cached)} cached conversations")
+                return cached
+
+        # Each type is paginated independently and in parallel; a workspace's
+        # pages are dominated by one type (usually DMs or public channels), so
+        # the other types no longer wait behind its cursor chain
+        types = self.CONVERSATION_TYPES
+        with ThreadPoolExecutor(max_workers=len(types)) as executor:
+            results = list(executor.map(self._list_conversations, types))
+
+        conversations = [conv for channels, _ in results for conv in channels]
+        complete = all(done for _, done in results)
+
+        # Only a complete listing is worth reusing
+        if complete:
+            self._save_cached_conversations(conversations)
 
         logger.info(f"Found {len(conversations)} total conversations")
         return conversations
 
     def get_conversation_history(
-        self, channel_id: str, days: int = 1, limit: int = 100
+        self,
+        channel_id: str,
+        days: int = 1,
+        limit: int = 1000,
+        require_user: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get message history from a conversation, including thread replies.
@@ -295,94 +932,116 @@ class SlackClient:
         Args:
             channel_id: Slack conversation ID
             days: Number of days to look back
-            limit: Maximum number of messages to retrieve
+            limit: Stop paging once this many messages inside the window are fetched
+            require_user: If set, return nothing (and skip the thread reply
+                fetches) unless this user may have posted or replied in the
+                window, including in threads started before it
 
         Returns:
-            List of message objects with recent activity
+            List of message objects with recent activity, each carrying its
+            parsed float timestamp under "_ts"
         """
-        messages = []
-        oldest_ts = (datetime.now() - timedelta(days=days)).timestamp()
+        messages = []  # Raw pages; only the filtered result below is ever returned
+        result = []
+        oldest_ts = time.time() - days * 86400
 
         try:
             # Don't use 'oldest' filter here - we need to find thread parents
             # that may be older but have recent thread replies
             params = {
                 "channel": channel_id,
-                "limit": min(limit, 100),  # Slack max is 100 per request
+                "limit": self.HISTORY_PAGE_SIZE,
             }
 
-            data = self._make_request("conversations.history", params)
-            messages = data.get("messages", [])
+            # Page through busy channels instead of silently truncating. Pages
+            # are newest first; stop once a page reaches past the window start.
+            in_window = 0
+            while True:
+                data = self._make_request("conversations.history", params)
+                page = data.get("messages", [])
+                messages.extend(page)
+                in_window += sum(1 for m in page if float(m.get("ts", 0)) >= oldest_ts)
 
-            # Filter out bot messages and system messages
-            messages = [
-                m for m in messages
-                if m.get("type") == "message"
-                and not m.get("subtype")  # Exclude join/leave/etc
-                and not m.get("bot_id")  # Exclude bot messages
-            ]
+                cursor = data.get("response_metadata", {}).get("next_cursor")
+                if (
+                    not page
+                    or float(page[-1].get("ts", 0)) < oldest_ts
+                    or in_window >= limit
+                    or not data.get("has_more")
+                    or not cursor
+                ):
+                    break
+                params["cursor"] = cursor
+
+            # Observer-only channels are dropped by the caller anyway, so bail out
+            # before paying for thread replies. The pages include older thread
+            # parents, so replies in threads started before the window count too.
+            is_human = self._is_human_message
+            if require_user and not any(
+                is_human(m) and self._may_involve_user(m, require_user, oldest_ts)
+                for m in messages
+            ):
+                logger.debug("Skipping %s - %s has no recent activity here", channel_id, require_user)
+                return []
 
             # Fetch thread replies for messages that are thread parents
             # Use 'oldest' filter here to only get recent thread activity
-            # Limit to 5 threads per channel to avoid rate limiting
+            # Skip threads whose latest_reply predates the window (no request needed)
             thread_messages = []
             threads_with_recent_activity = set()
-            threads_fetched = 0
-            max_threads_per_channel = 5
 
-            for msg in messages:
-                if threads_fetched >= max_threads_per_channel:
-                    break
-                reply_count = msg.get("reply_count", 0)
-                if reply_count > 0:
-                    thread_ts = msg.get("thread_ts") or msg.get("ts")
-                    replies = self._get_thread_replies(channel_id, thread_ts, days=days)
-                    threads_fetched += 1
-                    if replies:
-                        threads_with_recent_activity.add(thread_ts)
-                        thread_messages.extend(replies)
-                        logger.debug(f"Fetched {len(replies)} recent replies from thread {thread_ts}")
-
-            # Combine and deduplicate (parent message may appear in both)
-            if thread_messages:
-                all_messages = messages + thread_messages
-                seen_ts = set()
-                deduplicated = []
-                for msg in all_messages:
-                    ts = msg.get("ts")
-                    if ts not in seen_ts:
-                        seen_ts.add(ts)
-                        deduplicated.append(msg)
-                messages = deduplicated
-
-            # Now filter to only include:
-            # 1. Messages newer than the cutoff, OR
-            # 2. Thread parent messages that have recent thread activity
-            filtered = []
-            for msg in messages:
-                ts = float(msg.get("ts", 0))
-                thread_ts = msg.get("thread_ts") or msg.get("ts")
-
-                if ts >= oldest_ts:
-                    # Recent message
-                    filtered.append(msg)
-                elif thread_ts in threads_with_recent_activity:
-                    # Old thread parent with recent replies - include for context
-                    filtered.append(msg)
-
-            messages = filtered
-            if messages:
-                logger.debug(f"After filtering: {len(messages)} messages with recent activity")
+            thread_parents = [
+                msg.get("thread_ts") or msg.get("ts")
+                for msg in messages
+                if msg.get("reply_count", 0) > 0
+                and float(msg.get("latest_reply") or msg.get("ts", 0)) >= oldest_ts
+                and self._is_human_message(msg)
+            ]
+
+            if thread_parents:
+                # Thread fetches are independent, so overlap their round-trips
+                workers = min(len(thread_parents), self.THREAD_REPLY_WORKERS)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    all_replies = executor.map(
+                        lambda thread_ts: self._get_thread_replies(channel_id, thread_ts, days=days),
+                        thread_parents,
+                    )
+                    for thread_ts, replies in zip(thread_parents, all_replies):
+                        if replies:
+                            threads_with_recent_activity.add(thread_ts)
+                            thread_messages.extend(replies)
+                            logger.debug("Fetched %s recent replies from thread %s", len(replies), thread_ts)
+
+            # Filter, combine and deduplicate in a single pass. Keep human messages
+            # that are either newer than the cutoff or old thread parents with
+            # recent replies (for context). A parent may appear in both lists;
+            # the thread copy wins but keeps the history position. The parsed
+            # ts is kept on the message as "_ts" so formatting doesn't reparse it.
+            combined = {}
+            for msg in chain(messages, thread_messages):
+                if not is_human(msg):
+                    continue
+                ts = msg.get("ts", "0")
+                ts_float = float(ts)
+                if ts_float >= oldest_ts or (msg.get("thread_ts") or ts) in threads_with_recent_activity:
+                    msg["_ts"] = ts_float
+                    combined[ts] = msg
+
+            result = list(combined.values())
+            if result:
+                logger.debug("After filtering: %s messages with recent activity", len(result))
 
         except Exception as e:
             # Common error: not_in_channel for private channels we can't access
             error_str = str(e)
             if "not_in_channel" in error_str or "channel_not_found" in error_str:
-                logger.debug(f"Cannot access channel {channel_id}: {e}")
+                logger.debug("Cannot access channel %s: %s", channel_id, e)
             else:
                 logger.error(f"Error fetching history for {channel_id}: {e}")
+            # Messages collected before the failure are unfiltered; drop them
+            result = []
 
-        return messages
+        return result
 
     def search_messages_with_query(self, query: str) -> List[Dict[str, Any]]:
         """
@@ -401,6 +1060,7 @@ class SlackClient:
             params = {
                 "query": query,
                 "sort": "timestamp",
+                "sort_dir": "desc",
                 "count": 100,
                 "page": page,
             }
@@ -409,17 +1069,17 @@ class SlackClient:
             matches = data.get("messages", {}).get("matches", [])
             messages.extend(matches)
 
-            # Check pagination
+            # Stop on the last page Slack reports, never requesting an empty one
             paging = data.get("messages", {}).get("paging", {})
             total_pages = paging.get("pages", 1)
-            if page >= total_pages:
+            if not matches or page >= total_pages:
                 break
-            page += 1
 
             # Safety limit to avoid infinite loops
-            if page > 20:
-                logger.warning("Reached max pages (20) in search, stopping")
+            if page >= self.MAX_SEARCH_PAGES:
+                logger.warning(f"Reached max pages ({self.MAX_SEARCH_PAGES}) in search, stopping")
                 break
+            page += 1
 
         return messages
 
@@ -437,7 +1097,7 @@ class SlackClient:
             List of message match objects from search API
         """
         # Use UTC-8 offset for consistent date across timezones
-        after_date = (datetime.utcnow() - timedelta(days=days, hours=8)).strftime("%Y-%m-%d")
+        after_date = time.strftime("%Y-%m-%d", time.gmtime(time.time() - days * 86400 - 8 * 3600))
         query = f"from:me OR to:me after:{after_date}"
         messages = self.search_messages_with_query(query)
         logger.info(f"Search API found {len(messages)} messages from last {days} day(s)")
@@ -458,16 +1118,24 @@ class SlackClient:
         # Use UTC-8 (Pacific) timezone offset to ensure consistent behavior
         # across local dev and Cloud Run (which runs in UTC)
         # This gives us a full day's worth of messages regardless of when the job runs
-        after_date = (datetime.utcnow() - timedelta(days=days, hours=8)).strftime("%Y-%m-%d")
+        after_date = time.strftime("%Y-%m-%d", time.gmtime(time.time() - days * 86400 - 8 * 3600))
         query = f"is:dm after:{after_date}"
 
         messages = self.search_messages_with_query(query)
         logger.info(f"Search API found {len(messages)} DM messages")
 
+        self._resolve_user_names(m.get("user") for m in messages if "username" not in m)
+
         content = []
+        action_hint = self._action_hint
+        skipped = 0
         for msg in messages:
-            # Skip bot messages
-            if msg.get("bot_id"):
+            # Skip bot messages and empty ones before doing any formatting work
+            text = msg.get("text")
+            if not text or msg.get("bot_id"):
+                continue
+            if action_hint and not action_hint(text):
+                skipped += 1
                 continue
 
             channel = msg.get("channel", {})
@@ -485,30 +1153,28 @@ class SlackClient:
             # Get message details
             ts = msg.get("ts", "0")
             user_id = msg.get("user", msg.get("username", "unknown"))
-            user_name = msg.get("username", self._get_user_name(user_id) if user_id != "unknown" else "unknown")
-            text = msg.get("text", "")
-            permalink = msg.get("permalink", self._build_message_url(channel_id, ts))
+            user_name = msg.get("username") or self.user_cache.get(user_id, user_id)
+            permalink = msg.get("permalink") or self._build_message_url(channel_id, ts)
 
             # Format timestamp
             try:
-                ts_float = float(ts)
-                timestamp = datetime.fromtimestamp(ts_float).strftime("%Y-%m-%d %H:%M")
+                timestamp = _fmt_minute(int(float(ts)) // 60)
             except:
                 timestamp = "unknown"
 
-            if text:
-                formatted_msg = f"[{timestamp}] @{user_name}: {text}"
+            content.append({
+                "text": f"=== Slack: {conv_name} ===\n[{timestamp}] @{user_name}: {text}",
+                "source_url": permalink,
+                "source": "slack",
+                "metadata": {
+                    "channel_id": channel_id,
+                    "channel_name": conv_name,
+                    "message_ts": ts,
+                }
+            })
 
-                content.append({
-                    "text": f"=== Slack: {conv_name} ===\n{formatted_msg}",
-                    "source_url": permalink,
-                    "source": "slack",
-                    "metadata": {
-                        "channel_id": channel_id,
-                        "channel_name": conv_name,
-                        "message_ts": ts,
-                    }
-                })
+        if skipped:
+            logger.debug("Skipped %s DM messages without an action hint", skipped)
 
         return content
 
@@ -527,14 +1193,15 @@ class SlackClient:
             List of channel conversation objects where user is active
         """
         # Build date filter - use days+1 because 'after:' is exclusive
-        date_str = (datetime.now() - timedelta(days=days + 1)).strftime("%Y-%m-%d")
+        date_str = time.strftime("%Y-%m-%d", time.localtime(time.time() - (days + 1) * 86400))
         query = f"from:me after:{date_str}"
 
         logger.info(f"Finding active channels via search: {query}")
 
         try:
             # Paginate through search results to find all channels
-            active_channel_ids = set()
+            # (a dict keeps them in most-recently-active order)
+            active_channel_ids: Dict[str, None] = {}
             page = 1
 
             while True:
@@ -547,7 +1214,7 @@ class SlackClient:
                 }
                 data = self._make_request("search.messages", params)
                 messages = data.get("messages", {}).get("matches", [])
-                total = data.get("messages", {}).get("total", 0)
+                total_pages = data.get("messages", {}).get("paging", {}).get("pages", 1)
 
                 if not messages:
                     break
@@ -558,9 +1225,9 @@ class SlackClient:
                     channel_id = channel.get("id", "")
                     # Skip DMs (start with D) and MPDMs (start with G for group)
                     if channel_id and channel_id.startswith("C"):
-                        active_channel_ids.add(channel_id)
+                        active_channel_ids[channel_id] = None
 
-                if len(messages) < 100 or page * 100 >= total:
+                if page >= min(total_pages, self.MAX_SEARCH_PAGES):
                     break
                 page += 1
 
@@ -569,12 +1236,24 @@ class SlackClient:
             if not active_channel_ids:
                 return []
 
-            # Get full channel info for the active channels
-            conversations = self.get_all_conversations()
-            active_channels = [
-                conv for conv in conversations
+            # Get full channel info for just the active channels: take what the
+            # cached conversation list has and look up the rest individually,
+            # rather than paging through every channel in the workspace
+            known = {
+                conv.get("id"): conv
+                for conv in self._load_cached_conversations() or []
                 if conv.get("id") in active_channel_ids
-                and not conv.get("is_archived", False)
+            }
+            missing = [channel_id for channel_id in active_channel_ids if channel_id not in known]
+            if missing:
+                with ThreadPoolExecutor(max_workers=min(len(missing), self.SEARCH_CHANNEL_WORKERS)) as executor:
+                    for channel_id, conv in zip(missing, executor.map(self._get_conversation_info, missing)):
+                        if conv:
+                            known[channel_id] = conv
+
+            active_channels = [
+                known[channel_id] for channel_id in active_channel_ids
+                if channel_id in known and not known[channel_id].get("is_archived", False)
             ]
 
             logger.info(f"Found {len(active_channels)} channels where user is active")
@@ -594,25 +1273,28 @@ class SlackClient:
         my_user_id = self._get_my_user_id()
         active_channels = []
 
-        for conv in conversations:
-            # Skip DMs (handled by search)
-            if conv.get("is_im") or conv.get("is_mpim"):
-                continue
-
-            # Skip archived
-            if conv.get("is_archived"):
-                continue
-
-            # Skip if not a member
-            if not conv.get("is_member", False):
-                continue
-
-            # Check if user posted recently in this channel
-            channel_id = conv.get("id")
-            if self._user_posted_recently(channel_id, days, my_user_id):
-                conv_name = self._get_conversation_name(conv)
-                logger.debug(f"User is active in {conv_name}")
-                active_channels.append(conv)
+        # Drop DMs (handled by search), archived, unjoined and provably dormant
+        # channels locally so only plausible candidates cost a request
+        oldest_ts = time.time() - days * 86400
+        candidates = [
+            conv for conv in conversations
+            if not (conv.get("is_im") or conv.get("is_mpim"))
+            and not conv.get("is_archived")
+            and conv.get("is_member", False)
+            and not self._is_dormant(conv, oldest_ts)
+        ]
+
+        # Check if user posted recently in each channel, a few at a time
+        with ThreadPoolExecutor(max_workers=self.SEARCH_CHANNEL_WORKERS) as executor:
+            posted = executor.map(
+                lambda conv: self._user_posted_recently(conv.get("id"), days, my_user_id),
+                candidates,
+            )
+            for conv, is_active in zip(candidates, posted):
+                if is_active:
+                    conv_name = self._get_conversation_name(conv)
+                    logger.debug("User is active in %s", conv_name)
+                    active_channels.append(conv)
 
         logger.info(f"Found {len(active_channels)} channels where user is active (slow method)")
         return active_channels
@@ -634,7 +1316,7 @@ class SlackClient:
         if not my_user_id:
             return False
 
-        oldest_ts = (datetime.now() - timedelta(days=days)).timestamp()
+        oldest_ts = time.time() - days * 86400
 
         try:
             params = {
@@ -646,17 +1328,13 @@ class SlackClient:
             messages = data.get("messages", [])
 
             # Check if any message is from the user
-            for msg in messages:
-                if msg.get("user") == my_user_id:
-                    return True
-
-            return False
+            return any(msg.get("user") == my_user_id for msg in messages)
 
         except Exception as e:
             error_str = str(e)
             if "not_in_channel" in error_str or "channel_not_found" in error_str:
                 return False
-            logger.debug(f"Error checking channel {channel_id}: {e}")
+            logger.debug("Error checking channel %s: %s", channel_id, e)
             return False
 
     def _get_channel_messages(self, conv: Dict[str, Any], days: int = 1) -> List[Dict[str, Any]]:
@@ -671,37 +1349,48 @@ class SlackClient:
             List of formatted content dicts
         """
         channel_id = conv.get("id")
-        conv_name = self._get_conversation_name(conv)
         content = []
 
         messages = self.get_conversation_history(channel_id, days=days)
+        if not messages:
+            return []
 
+        # Name lookups only for channels that actually produced messages
+        conv_name = self._get_conversation_name(conv)
+        self._resolve_user_names(m.get("user") for m in messages)
+
+        # Lookups used on every iteration are bound to locals once up front
+        get_user_name = self.user_cache.get
+        build_url = self._build_message_url
+        append = content.append
+        action_hint = self._action_hint
+        skipped = 0
+        header = f"=== Slack: {conv_name} ===\n"
         for msg in reversed(messages):  # Oldest first for context
-            ts = msg.get("ts", "0")
-            try:
-                ts_float = float(ts)
-                timestamp = datetime.fromtimestamp(ts_float).strftime("%Y-%m-%d %H:%M")
-            except:
-                timestamp = "unknown"
+            text = msg.get("text")
+            if not text:
+                continue
+            if action_hint and not action_hint(text):
+                skipped += 1
+                continue
 
+            ts = msg.get("ts", "0")
+            timestamp = _fmt_minute(int(msg.get("_ts") or float(ts)) // 60)
             user_id = msg.get("user", "unknown")
-            user_name = self._get_user_name(user_id)
-
-            text = msg.get("text", "")
-            if text:
-                formatted_msg = f"[{timestamp}] @{user_name}: {text}"
-                source_url = self._build_message_url(channel_id, ts)
-
-                content.append({
-                    "text": f"=== Slack: {conv_name} ===\n{formatted_msg}",
-                    "source_url": source_url,
-                    "source": "slack",
-                    "metadata": {
-                        "channel_id": channel_id,
-                        "channel_name": conv_name,
-                        "message_ts": ts,
-                    }
-                })
+
+            append({
+                "text": f"{header}[{timestamp}] @{get_user_name(user_id, user_id)}: {text}",
+                "source_url": build_url(channel_id, ts),
+                "source": "slack",
+                "metadata": {
+                    "channel_id": channel_id,
+                    "channel_name": conv_name,
+                    "message_ts": ts,
+                }
+            })
+
+        if skipped:
+            logger.debug("Skipped %s messages without an action hint in %s", skipped, conv_name)
 
         return content
 
@@ -717,6 +1406,11 @@ class SlackClient:
         Returns:
             List of structured content dicts with text, source_url, source, and metadata
         """
+        # On a cold start every author lookup would miss, so load the whole
+        # user directory up front instead of waiting for the first miss
+        if not self.user_cache:
+            self._prime_user_cache()
+
         try:
             # Try search API first (requires search:read scope)
             return self._get_slack_content_via_search(days)
@@ -726,6 +1420,8 @@ class SlackClient:
                 logger.warning("search:read scope not available, falling back to conversation scan")
                 return self._get_slack_content_via_scan(days)
             raise
+        finally:
+            self.save_disk_cache()
 
     def _get_slack_content_via_search(self, days: int = 1) -> List[Dict[str, Any]]:
         """
@@ -747,9 +1443,15 @@ class SlackClient:
 
         content = []
 
+        # The DM search and the active-channel search are independent, so run
+        # them side by side (their date windows differ, so they stay two queries)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dm_future = executor.submit(self._search_dms, days)
+            channels_future = executor.submit(self._get_active_channels, days)
+
         # Bucket 1: DMs via Search API (fast)
         try:
-            dm_content = self._search_dms(days)
+            dm_content = dm_future.result()
             content.extend(dm_content)
             logger.info(f"Bucket 1 (DM search): {len(dm_content)} messages")
         except Exception as e:
@@ -757,15 +1459,19 @@ class SlackClient:
 
         # Bucket 2: Scan only channels where user actively participated
         try:
-            active_channels = self._get_active_channels(days)
+            active_channels = channels_future.result()
             logger.info(f"Bucket 2: Scanning {len(active_channels)} active channels")
 
-            for conv in active_channels:
-                channel_content = self._get_channel_messages(conv, days)
-                content.extend(channel_content)
-                if channel_content:
-                    conv_name = self._get_conversation_name(conv)
-                    logger.debug(f"  {conv_name}: {len(channel_content)} messages")
+            # Channels are independent; map() keeps results in channel order
+            with ThreadPoolExecutor(max_workers=self.SEARCH_CHANNEL_WORKERS) as executor:
+                for conv, channel_content in zip(
+                    active_channels,
+                    executor.map(lambda conv: self._get_channel_messages(conv, days), active_channels),
+                ):
+                    content.extend(channel_content)
+                    if channel_content:
+                        conv_name = self._get_conversation_name(conv)
+                        logger.debug("  %s: %s messages", conv_name, len(channel_content))
 
         except Exception as e:
             logger.warning(f"Channel scan failed: {e}")
@@ -773,6 +1479,110 @@ class SlackClient:
         logger.info(f"Collected {len(content)} total Slack messages via hybrid approach")
         return content
 
+    def _fetch_and_format_conversation(
+        self, conv: Dict[str, Any], days: int = 1, my_user_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch one conversation's recent history and format it as content dicts.
+
+        Args:
+            conv: Conversation object from Slack API
+            days: Number of days to look back
+            my_user_id: Authenticated user's ID for the participation check
+
+        Returns:
+            List of structured content dicts (empty if the conversation is skipped)
+        """
+        content = []
+        channel_id = conv.get("id")
+        is_dm = conv.get("is_im") or conv.get("is_mpim")
+
+        # Get messages; for channels, history gives up before fetching thread
+        # replies when the user hasn't posted or replied at all
+        messages = self.get_conversation_history(
+            channel_id, days=days, require_user=None if is_dm else my_user_id
+        )
+
+        if not messages:
+            return []
+
+        # For channels (not DMs), skip if user hasn't participated (no messages from user)
+        # This prevents extracting todos from conversations the user just observes
+        # DMs (is_im/is_mpim) are always included since they're directed at the user
+        # The author set is built once and reused for name resolution below
+        authors = {msg.get("user") for msg in messages}
+        if not is_dm and my_user_id and my_user_id not in authors:
+            logger.debug("Skipping %s - user has no messages in this channel", channel_id)
+            return []
+
+        # Resolve the name only for conversations we keep (DMs may need users.info)
+        conv_name = self._get_conversation_name(conv)
+        self._resolve_user_names(authors)
+
+        # Create one content entry per message (for accurate source URL mapping).
+        # Lookups used on every iteration are bound to locals once up front.
+        get_user_name = self.user_cache.get
+        build_url = self._build_message_url
+        append = content.append
+        action_hint = self._action_hint
+        skipped = 0
+        header = f"=== Slack: {conv_name} ===\n"
+        for msg in reversed(messages):  # Oldest first for context
+            text = msg.get("text")
+            if not text:
+                continue
+            if action_hint and not action_hint(text):
+                skipped += 1
+                continue
+
+            ts = msg.get("ts", "0")
+            user_id = msg.get("user", "unknown")
+            timestamp = _fmt_minute(int(msg.get("_ts") or float(ts)) // 60)
+
+            append({
+                "text": f"{header}[{timestamp}] @{get_user_name(user_id, user_id)}: {text}",
+                "source_url": build_url(channel_id, ts),
+                "source": "slack",
+                "metadata": {
+                    "channel_id": channel_id,
+                    "channel_name": conv_name,
+                    "message_ts": ts,
+                }
+            })
+
+        if skipped:
+            logger.debug("Skipped %s messages without an action hint in %s", skipped, conv_name)
+        if content:
+            logger.debug("Collected %s messages from %s", len(content), conv_name)
+
+        return content
+
+    @staticmethod
+    def _is_dormant(conv: Dict[str, Any], oldest_ts: float) -> bool:
+        """
+        Check whether a channel provably has nothing newer than oldest_ts.
+
+        Slack's 'updated' (milliseconds) is only trusted when the conversation's
+        latest message is known and has no thread replies, since replies don't
+        always bump it. DMs are never treated as dormant.
+
+        Args:
+            conv: Conversation object from Slack API
+            oldest_ts: Start of the lookback window (Unix seconds)
+
+        Returns:
+            True if the history fetch can be skipped
+        """
+        if conv.get("is_im") or conv.get("is_mpim"):
+            return False
+
+        updated_ms = conv.get("updated")
+        latest = conv.get("latest")
+        if not updated_ms or not isinstance(latest, dict):
+            return False
+
+        return updated_ms / 1000 < oldest_ts and latest.get("reply_count", 0) == 0
+
     def _get_slack_content_via_scan(self, days: int = 1) -> List[Dict[str, Any]]:
         """
         Slow fallback: scan all conversations individually.
@@ -788,73 +1598,34 @@ class SlackClient:
         content = []
         conversations = self.get_all_conversations()
 
-        # Note: We don't filter by 'updated' timestamp because Slack thread replies
-        # don't always update the conversation's 'updated' field. Instead, we rely on:
+        # Note: We only trust the 'updated' timestamp when the conversation's latest
+        # message shows no thread activity, because Slack thread replies don't always
+        # update it (see _is_dormant). Otherwise we rely on:
         # 1. is_member filter to only scan channels user is in
         # 2. conversations.history with oldest parameter to get only recent messages
         # 3. Participation filter to skip channels where user hasn't participated
         logger.info(f"Scanning {len(conversations)} conversations for recent activity")
 
-        for conv in conversations:
-            channel_id = conv.get("id")
-            conv_name = self._get_conversation_name(conv)
-
-            # Skip archived conversations
-            if conv.get("is_archived"):
-                continue
-
-            # Skip channels user hasn't joined (only scan conversations user is part of)
-            if not conv.get("is_member", False):
-                logger.debug(f"Skipping {conv_name} - user is not a member")
-                continue
-
-            # Get messages
-            messages = self.get_conversation_history(channel_id, days=days)
-
-            if not messages:
-                continue
-
-            # For channels (not DMs), skip if user hasn't participated (no messages from user)
-            # This prevents extracting todos from conversations the user just observes
-            # DMs (is_im/is_mpim) are always included since they're directed at the user
-            is_dm = conv.get("is_im") or conv.get("is_mpim")
-            if not is_dm:
-                my_user_id = self._get_my_user_id()
-                if my_user_id:
-                    user_participated = any(msg.get("user") == my_user_id for msg in messages)
-                    if not user_participated:
-                        logger.debug(f"Skipping {conv_name} - user has no messages in this channel")
-                        continue
-
-            # Create one content entry per message (for accurate source URL mapping)
-            message_count = 0
-            for msg in reversed(messages):  # Oldest first for context
-                ts = msg.get("ts", "0")
-                ts_float = float(ts)
-                timestamp = datetime.fromtimestamp(ts_float).strftime("%Y-%m-%d %H:%M")
-
-                user_id = msg.get("user", "unknown")
-                user_name = self._get_user_name(user_id)
+        # Apply the purely local filters up front so skipped conversations
+        # never cost a request: drop archived, unjoined and provably dormant ones.
+        # IM objects carry no is_member flag, so DMs are kept explicitly.
+        oldest_ts = time.time() - days * 86400
+        conversations = [
+            conv for conv in conversations
+            if not conv.get("is_archived")
+            and (conv.get("is_member") or conv.get("is_im") or conv.get("is_mpim"))
+            and not self._is_dormant(conv, oldest_ts)
+        ]
+        my_user_id = self._get_my_user_id()
 
-                text = msg.get("text", "")
-                if text:
-                    formatted_msg = f"[{timestamp}] @{user_name}: {text}"
-                    source_url = self._build_message_url(channel_id, ts)
-
-                    content.append({
-                        "text": f"=== Slack: {conv_name} ===\n{formatted_msg}",
-                        "source_url": source_url,
-                        "source": "slack",
-                        "metadata": {
-                            "channel_id": channel_id,
-                            "channel_name": conv_name,
-                            "message_ts": ts,
-                        }
-                    })
-                    message_count += 1
-
-            if message_count > 0:
-                logger.debug(f"Collected {message_count} messages from {conv_name}")
+        # Conversations are independent, so fetch them concurrently; map() keeps
+        # results in conversation order
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            for conv_content in executor.map(
+                lambda conv: self._fetch_and_format_conversation(conv, days, my_user_id),
+                conversations,
+            ):
+                content.extend(conv_content)
 
         logger.info(f"Collected {len(content)} Slack messages for todo extraction")
         return content
@@ -867,6 +1638,7 @@ class SlackClient:
             True if connection successful
         """
         try:
+            # Always hit the API; a cached auth.test would hide a revoked token
             data = self._make_request("auth.test")
             user = data.get("user", "unknown")
             team = data.get("team", "unknown")
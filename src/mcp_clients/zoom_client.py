@@ -1,20 +1,49 @@
 """Zoom API client for fetching meeting summaries and transcripts."""
 
+import hashlib
 import logging
+import threading
 import time
 import urllib.parse
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Access tokens shared by every ZoomClient in the process, keyed by a hash of
+# the Server-to-Server OAuth credentials: key -> (access_token, expiry)
+_TOKEN_CACHE: Dict[str, Tuple[str, datetime]] = {}
+_TOKEN_LOCK = threading.Lock()
+
 
 class ZoomClient:
     """Client for interacting with Zoom API to fetch meeting data."""
 
+    # Concurrent past-instance and summary fetches; every request is
+    # network-bound, so wall-clock time drops roughly with the worker count.
+    # The connection pool is sized to match so connections are reused.
+    MAX_WORKERS = 8
+
+    # A cached token this close to its (already buffered) expiry is still
+    # handed out, but a fresh one is fetched in the background
+    TOKEN_REFRESH_AHEAD_SECONDS = 60
+
+    # Transcripts are downloaded and parsed in chunks of this many bytes
+    TRANSCRIPT_CHUNK_SIZE = 64 * 1024
+
     def __init__(self):
         """Initialize Zoom client with OAuth credentials."""
         self.account_id = Config.ZOOM_ACCOUNT_ID
@@ -23,6 +52,29 @@ class ZoomClient:
         self.base_url = "https://api.zoom.us/v2"
         self.access_token = None
         self.token_expiry = None
+        self._token_key = hashlib.sha256(
+            f"{self.account_id}:{self.client_id}:{self.client_secret}".encode()
+        ).hexdigest()
+
+        # Keep-alive connections to zoom.us / api.zoom.us shared by all requests.
+        # Rate limits (429) and transient 5xx are retried with backoff here;
+        # whatever the last attempt returns is handled by raise_for_status.
+        self._session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=self.MAX_WORKERS,
+                pool_maxsize=self.MAX_WORKERS,
+                max_retries=retry,
+            ),
+        )
 
     def _build_meeting_url(self, meeting_id: str, recording_id: str = None) -> str:
         """
@@ -48,12 +100,50 @@ class ZoomClient:
         Returns:
             Access token string
         """
-        # Check if we have a valid cached token
-        if self.access_token and self.token_expiry:
-            if datetime.now() < self.token_expiry:
+        # Check for a valid token cached by any client with these credentials
+        cached = _TOKEN_CACHE.get(self._token_key)
+        if cached and datetime.now() < cached[1]:
+            if cached[1] - datetime.now() < timedelta(seconds=self.TOKEN_REFRESH_AHEAD_SECONDS):
+                self._refresh_token_in_background()
+            self.access_token, self.token_expiry = cached
+            return self.access_token
+
+        with _TOKEN_LOCK:
+            # Another thread may have refreshed the token while we waited
+            cached = _TOKEN_CACHE.get(self._token_key)
+            if cached and datetime.now() < cached[1]:
+                self.access_token, self.token_expiry = cached
                 return self.access_token
+            return self._request_access_token()
+
+    def _refresh_token_in_background(self):
+        """Fetch a new token on a daemon thread so callers never wait on it."""
+        if _TOKEN_LOCK.locked():
+            return  # A token request is already in progress
+
+        def refresh():
+            with _TOKEN_LOCK:
+                # Another thread may have refreshed the token already
+                cached = _TOKEN_CACHE.get(self._token_key)
+                ahead = timedelta(seconds=self.TOKEN_REFRESH_AHEAD_SECONDS)
+                if cached and cached[1] - datetime.now() >= ahead:
+                    return
+                try:
+                    self._request_access_token()
+                except Exception:
+                    pass  # Already logged; the next caller past expiry retries
 
-        # Get new token
+        threading.Thread(target=refresh, name="zoom-token-refresh", daemon=True).start()
+
+    def _request_access_token(self) -> str:
+        """
+        Request a new OAuth access token and cache it for the process.
+
+        Callers must hold _TOKEN_LOCK.
+
+        Returns:
+            Access token string
+        """
         url = f"https://zoom.us/oauth/token?grant_type=account_credentials&account_id={self.account_id}"
 
         # Create Basic Auth header
@@ -65,7 +155,7 @@ class ZoomClient:
         }
 
         try:
-            response = requests.post(url, headers=headers)
+            response = self._session.post(url, headers=headers)
             response.raise_for_status()
             data = response.json()
 
@@ -73,6 +163,7 @@ class ZoomClient:
             # Set expiry with 5 min buffer
             expires_in = data.get("expires_in", 3600)
             self.token_expiry = datetime.now() + timedelta(seconds=expires_in - 300)
+            _TOKEN_CACHE[self._token_key] = (self.access_token, self.token_expiry)
 
             logger.info("Successfully obtained Zoom access token")
             return self.access_token
@@ -100,9 +191,10 @@ class ZoomClient:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._session.get(url, headers=headers, params=params)
             response.raise_for_status()
-            return response.json()
+            # orjson parses the raw bytes directly and is much faster on large pages
+            return orjson.loads(response.content) if HAS_ORJSON else response.json()
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error making Zoom API request to {endpoint}: {e}")
@@ -110,6 +202,39 @@ class ZoomClient:
                 logger.error(f"Response: {response.text}")
             raise
 
+    def _get_past_instances(self, meeting_id: Any) -> List[Dict[str, Any]]:
+        """
+        Get past instances of a scheduled meeting.
+
+        Args:
+            meeting_id: Zoom meeting ID
+
+        Returns:
+            List of past instance objects (empty if none or on error)
+        """
+        try:
+            data = self._make_request(f"/past_meetings/{meeting_id}/instances")
+            return data.get("meetings", [])
+        except Exception as e:
+            logger.debug("No past instances for meeting %s: %s", meeting_id, e)
+            return []
+
+    def _get_all_past_instances(self, meetings: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Get past instances for several scheduled meetings in parallel.
+
+        Args:
+            meetings: Scheduled meeting objects
+
+        Returns:
+            One list of past instances per meeting, in the same order
+        """
+        if not meetings:
+            return []
+        meeting_ids = [meeting.get("id") for meeting in meetings]
+        with ThreadPoolExecutor(max_workers=min(len(meeting_ids), self.MAX_WORKERS)) as executor:
+            return list(executor.map(self._get_past_instances, meeting_ids))
+
     def get_recent_meetings(
         self, user_id: str = "me", days: int = 7, page_size: int = 30
     ) -> List[Dict[str, Any]]:
@@ -136,33 +261,25 @@ class ZoomClient:
             past_meetings = []
             cutoff_date = datetime.now() - timedelta(days=days)
 
-            for meeting in scheduled_meetings:
-                meeting_id = meeting.get("id")
-                try:
-                    # Get past instances for this meeting
-                    instances_data = self._make_request(f"/past_meetings/{meeting_id}/instances")
-                    instances = instances_data.get("meetings", [])
-
-                    # Filter instances within the date range
-                    for instance in instances:
-                        start_time_str = instance.get("start_time", "")
-                        if start_time_str:
-                            try:
-                                # Parse the datetime (handle Z timezone)
-                                start_time = datetime.strptime(start_time_str, "%Y-%m-%dT%H:%M:%SZ")
-                                # Make cutoff_date timezone-naive for comparison
-                                if start_time >= cutoff_date.replace(tzinfo=None):
-                                    # Add meeting topic from scheduled meeting
-                                    instance["topic"] = meeting.get("topic", "Unknown Meeting")
-                                    past_meetings.append(instance)
-                            except ValueError:
-                                # If parsing fails, include the meeting anyway
+            all_instances = self._get_all_past_instances(scheduled_meetings)
+
+            for meeting, instances in zip(scheduled_meetings, all_instances):
+                # Filter instances within the date range
+                for instance in instances:
+                    start_time_str = instance.get("start_time", "")
+                    if start_time_str:
+                        try:
+                            # Parse the datetime (handle Z timezone)
+                            start_time = datetime.strptime(start_time_str, "%Y-%m-%dT%H:%M:%SZ")
+                            # Make cutoff_date timezone-naive for comparison
+                            if start_time >= cutoff_date.replace(tzinfo=None):
+                                # Add meeting topic from scheduled meeting
                                 instance["topic"] = meeting.get("topic", "Unknown Meeting")
                                 past_meetings.append(instance)
-
-                except Exception as e:
-                    logger.debug(f"No past instances for meeting {meeting_id}: {e}")
-                    continue
+                        except ValueError:
+                            # If parsing fails, include the meeting anyway
+                            instance["topic"] = meeting.get("topic", "Unknown Meeting")
+                            past_meetings.append(instance)
 
             logger.info(f"Retrieved {len(past_meetings)} past meeting instances from last {days} days")
             return past_meetings
@@ -206,7 +323,7 @@ class ZoomClient:
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
-                logger.debug(f"No AI summary available for meeting {meeting_id}")
+                logger.debug("No AI summary available for meeting %s", meeting_id)
             else:
                 logger.error(f"Error fetching meeting summary: {e}")
             return None
@@ -238,23 +355,30 @@ class ZoomClient:
                     download_url = file.get("download_url")
                     if download_url:
                         token = self._get_access_token()
-                        response = requests.get(
+                        with self._session.get(
                             download_url,
                             headers={"Authorization": f"Bearer {token}"},
-                        )
-                        response.raise_for_status()
-
-                        # Parse VTT transcript
-                        transcript_text = self._parse_transcript(response.text)
+                            stream=True,
+                            timeout=60,
+                        ) as response:
+                            response.raise_for_status()
+                            # WebVTT is always UTF-8
+                            if response.encoding is None:
+                                response.encoding = "utf-8"
+
+                            # Parse VTT transcript as it downloads
+                            transcript_text = self._parse_transcript_lines(
+                                self._iter_response_lines(response)
+                            )
                         logger.info(f"Retrieved transcript for meeting {meeting_id}")
                         return transcript_text
 
-            logger.debug(f"No transcript available for meeting {meeting_id}")
+            logger.debug("No transcript available for meeting %s", meeting_id)
             return None
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
-                logger.debug(f"No recordings/transcript for meeting {meeting_id}")
+                logger.debug("No recordings/transcript for meeting %s", meeting_id)
             else:
                 logger.error(f"Error fetching transcript: {e}")
             return None
@@ -262,6 +386,30 @@ class ZoomClient:
             logger.error(f"Error fetching transcript: {e}")
             return None
 
+    @staticmethod
+    def _iter_response_lines(
+        response: requests.Response, chunk_size: int = TRANSCRIPT_CHUNK_SIZE
+    ) -> Iterator[str]:
+        """
+        Yield the lines of a streamed text response as chunks arrive.
+
+        Lines are split on "\n" exactly like str.split, so the result matches
+        parsing the fully downloaded text.
+
+        Args:
+            response: Response opened with stream=True
+            chunk_size: Bytes read per chunk
+
+        Yields:
+            Lines of the decoded response body
+        """
+        pending = ""
+        for chunk in response.iter_content(chunk_size=chunk_size, decode_unicode=True):
+            lines = (pending + chunk).split("\n")
+            pending = lines.pop()
+            yield from lines
+        yield pending
+
     def _parse_transcript(self, vtt_text: str) -> str:
         """
         Parse VTT transcript format to plain text.
@@ -269,29 +417,39 @@ class ZoomClient:
         Args:
             vtt_text: VTT formatted transcript
 
+        Returns:
+            Plain text transcript
+        """
+        return self._parse_transcript_lines(vtt_text.split("\n"))
+
+    @staticmethod
+    def _parse_transcript_lines(vtt_lines: Iterable[str]) -> str:
+        """
+        Parse VTT transcript lines to plain text, keeping the first text line of each cue.
+
+        Args:
+            vtt_lines: Lines of a VTT formatted transcript
+
         Returns:
             Plain text transcript
         """
         lines = []
+        append = lines.append
         in_cue = False
 
-        for line in vtt_text.split("\n"):
+        for line in vtt_lines:
             line = line.strip()
 
-            # Skip VTT headers and timestamps
-            if line.startswith("WEBVTT") or "-->" in line or line.isdigit():
-                in_cue = False
-                continue
-
-            # Empty line indicates end of cue
-            if not line:
+            # Empty line, VTT header, timestamp or cue number ends the cue.
+            # Cheapest checks first; most lines are one of these.
+            if not line or "-->" in line or line.isdigit() or line.startswith("WEBVTT"):
                 in_cue = False
                 continue
 
             # This is transcript text
             if not in_cue:
                 in_cue = True
-                lines.append(line)
+                append(line)
 
         return " ".join(lines)
 
@@ -319,83 +477,86 @@ class ZoomClient:
             scheduled_meetings = data.get("meetings", [])
             logger.info(f"Found {len(scheduled_meetings)} scheduled meetings")
 
-            # For each scheduled meeting, get past instances within date range
-            for meeting in scheduled_meetings:
+            # Fetch past instances for every scheduled meeting in parallel
+            all_instances = self._get_all_past_instances(scheduled_meetings)
+
+            # Keep instances within the date range
+            cutoff = cutoff_date.replace(tzinfo=None)
+            in_range = []
+            for meeting, instances in zip(scheduled_meetings, all_instances):
+                for instance in instances:
+                    start_time_str = instance.get("start_time", "")
+                    instance_uuid = instance.get("uuid")
+                    if not start_time_str or not instance_uuid:
+                        continue
+
+                    try:
+                        start_time = datetime.strptime(start_time_str, "%Y-%m-%dT%H:%M:%SZ")
+                    except ValueError:
+                        # Skip instances with invalid date format
+                        continue
+                    if start_time < cutoff:
+                        continue
+
+                    in_range.append((meeting, instance_uuid, start_time_str))
+
+            # Try to get AI summaries for those instances, also in parallel
+            summaries = []
+            if in_range:
+                with ThreadPoolExecutor(max_workers=min(len(in_range), self.MAX_WORKERS)) as executor:
+                    summaries = list(executor.map(
+                        self.get_meeting_summary, [instance_uuid for _, instance_uuid, _ in in_range]
+                    ))
+
+            for (meeting, instance_uuid, start_time_str), summary in zip(in_range, summaries):
+                if not summary:
+                    continue
+
                 meeting_id = meeting.get("id")
                 meeting_topic = meeting.get("topic", "Unknown Meeting")
 
                 try:
-                    # Get past instances
-                    instances_data = self._make_request(f"/past_meetings/{meeting_id}/instances")
-                    instances = instances_data.get("meetings", [])
-
-                    for instance in instances:
-                        start_time_str = instance.get("start_time", "")
-                        if not start_time_str:
-                            continue
-
-                        try:
-                            # Parse datetime and check if within range
-                            start_time = datetime.strptime(start_time_str, "%Y-%m-%dT%H:%M:%SZ")
-                            if start_time < cutoff_date.replace(tzinfo=None):
-                                continue
-
-                            # Try to get AI summary for this instance
-                            instance_uuid = instance.get("uuid")
-                            if instance_uuid:
-                                summary = self.get_meeting_summary(instance_uuid)
-                                if summary:
-                                    # Use pre-formatted summary_content if available, otherwise build it
-                                    summary_text = summary.get("summary_content", "")
-
-                                    if not summary_text:
-                                        # Build summary from components
-                                        summary_overview = summary.get("summary_overview", "")
-                                        summary_details = summary.get("summary_details", [])
-                                        next_steps = summary.get("next_steps", [])
-
-                                        summary_text = f"{summary_overview}\n\n"
-
-                                        if summary_details:
-                                            summary_text += "Details:\n"
-                                            for detail in summary_details:
-                                                label = detail.get('label', '')
-                                                text = detail.get('summary', '')
-                                                summary_text += f"\n{label}:\n{text}\n"
-                                            summary_text += "\n"
-
-                                        if next_steps:
-                                            summary_text += "Next Steps:\n"
-                                            for step in next_steps:
-                                                summary_text += f"- {step}\n"
-
-                                    if summary_text.strip():
-                                        header = f"=== Zoom Meeting: {meeting_topic} ({start_time_str}) ==="
-                                        formatted_text = f"{header}\n\n{summary_text}"
-
-                                        # Build URL to the meeting
-                                        source_url = self._build_meeting_url(meeting_id)
-
-                                        content.append({
-                                            "text": formatted_text,
-                                            "source_url": source_url,
-                                            "source": "zoom",
-                                            "metadata": {
-                                                "meeting_id": meeting_id,
-                                                "instance_uuid": instance_uuid,
-                                                "topic": meeting_topic,
-                                                "start_time": start_time_str,
-                                            }
-                                        })
-                                        logger.debug(f"Retrieved summary for {meeting_topic}")
-
-                        except ValueError:
-                            # Skip instances with invalid date format
-                            continue
+                    # Use pre-formatted summary_content if available, otherwise build it
+                    summary_text = summary.get("summary_content", "")
+
+                    if not summary_text:
+                        # Build summary from components
+                        summary_overview = summary.get("summary_overview", "")
+                        summary_details = summary.get("summary_details", [])
+                        next_steps = summary.get("next_steps", [])
+
+                        summary_text = f"{summary_overview}\n\n"
+
+                        if summary_details:
+                            summary_text += "Details:\n"
+                            for detail in summary_details:
+                                label = detail.get('label', '')
+                                text = detail.get('summary', '')
+                                summary_text += f"\n{label}:\n{text}\n"
+                            summary_text += "\n"
+
+                        if next_steps:
+                            summary_text += "Next Steps:\n"
+                            for step in next_steps:
+                                summary_text += f"- {step}\n"
+
+                    if summary_text.strip():
+                        content.append({
+                            "text": f"=== Zoom Meeting: {meeting_topic} ({start_time_str}) ===\n\n{summary_text}",
+                            "source_url": self._build_meeting_url(meeting_id),
+                            "source": "zoom",
+                            "metadata": {
+                                "meeting_id": meeting_id,
+                                "instance_uuid": instance_uuid,
+                                "topic": meeting_topic,
+                                "start_time": start_time_str,
+                            }
+                        })
+                        logger.debug("Retrieved summary for %s", meeting_topic)
 
                 except Exception as e:
-                    # No past instances for this meeting, or other error
-                    logger.debug(f"No past instances or summaries for {meeting_topic}: {e}")
+                    # Malformed summary; skip this instance
+                    logger.debug("Could not format summary for %s: %s", meeting_topic, e)
                     continue
 
         except Exception as e:
@@ -1,5 +1,15 @@
 """Email notifications for Todo Aggregator."""
 
-from .email_sender import send_error_email, send_success_email, send_welcome_email
+from .email_sender import (
+    EmailSender,
+    send_error_email,
+    send_success_email,
+    send_welcome_email,
+)
 
-__all__ = ["send_success_email", "send_error_email", "send_welcome_email"]
+__all__ = [
+    "EmailSender",
+    "send_success_email",
+    "send_error_email",
+    "send_welcome_email",
+]
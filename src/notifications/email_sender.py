@@ -3,6 +3,7 @@
 import logging
 import os
 import smtplib
+from typing import Optional
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -16,39 +17,162 @@ SMTP_PORT = int(os.environ.get("SMTP_PORT", "587"))
 SMTP_USER = os.environ.get("SMTP_USER", "")
 SMTP_PASSWORD = os.environ.get("SMTP_PASSWORD", "")
 SMTP_FROM = os.environ.get("SMTP_FROM", "noreply@company.com")
+# Seconds to wait on the SMTP server before giving up, so a half-open
+# connection can't hang a batch run
+SMTP_TIMEOUT = 30
 BASE_URL = os.environ.get(
     "BASE_URL", "https://todo-aggregator-908833572352.us-central1.run.app"
 )
 
 
-def _send_email(to_email: str, subject: str, html_body: str) -> bool:
+def _smtp_configured() -> bool:
+    """Whether SMTP credentials are set."""
+    return all([SMTP_HOST, SMTP_USER, SMTP_PASSWORD])
+
+
+def _connect() -> smtplib.SMTP:
+    """Open an authenticated SMTP connection."""
+    server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
+    try:
+        server.starttls()
+        server.login(SMTP_USER, SMTP_PASSWORD)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _build_message(to_email: str, subject: str, html_body: str) -> MIMEMultipart:
+    """Build an HTML email message."""
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = subject
+    msg["From"] = SMTP_FROM
+    msg["To"] = to_email
+
+    # Add HTML content
+    html_part = MIMEText(html_body, "html")
+    msg.attach(html_part)
+    return msg
+
+
+class EmailSender:
+    """Sends several emails over one SMTP connection.
+
+    Opening a connection costs a TLS handshake and a login, so batch
+    notification runs should share one sender. The connection is opened on
+    the first send, not on enter.
+
+    With deferred=True, emails are queued and all sent on exit. Use this
+    when sends are minutes apart (e.g. one per user in a batch run), where
+    the server would otherwise drop the idle connection between them:
+
+        with EmailSender(deferred=True) as sender:
+            for user in users:
+                ...
+                send_success_email(..., sender=sender)
+    """
+
+    def __init__(self, deferred: bool = False):
+        self.server = None
+        self.deferred = deferred
+        self._pending = []  # (to_email, subject, html_body) queued while deferred
+
+    def __enter__(self) -> "EmailSender":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Queued emails still go out if the batch failed part-way
+        self.flush()
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except Exception:
+                pass
+            self.server = None
+
+    def flush(self) -> None:
+        """Send every queued email over one connection."""
+        pending, self._pending = self._pending, []
+        if pending:
+            logger.info(f"Sending {len(pending)} queued emails")
+        for to_email, subject, html_body in pending:
+            self._deliver(to_email, subject, html_body)
+
+    def send(self, to_email: str, subject: str, html_body: str) -> bool:
+        """Send an HTML email over the shared connection (or queue it if deferred).
+
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            html_body: HTML content
+
+        Returns:
+            True if sent (or queued) successfully, False otherwise
+        """
+        if not _smtp_configured() or not to_email:
+            logger.warning("SMTP not configured or no recipient, skipping email")
+            return False
+
+        if self.deferred:
+            self._pending.append((to_email, subject, html_body))
+            return True
+
+        return self._deliver(to_email, subject, html_body)
+
+    def _deliver(self, to_email: str, subject: str, html_body: str) -> bool:
+        """Send one email, connecting (or reconnecting) as needed."""
+        if self.server is None:
+            # First send, or an earlier connection attempt failed
+            try:
+                self.server = _connect()
+            except Exception as e:
+                logger.error(f"SMTP connection unavailable, skipping email to {to_email}: {e}")
+                return False
+
+        msg = _build_message(to_email, subject, html_body)
+
+        try:
+            try:
+                self.server.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                # Server dropped the connection; reconnect once
+                self.server.close()
+                self.server = None
+                self.server = _connect()
+                self.server.send_message(msg)
+            logger.info(f"Sent email to {to_email}: {subject}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to send email to {to_email}: {e}")
+            return False
+
+
+def _send_email(
+    to_email: str, subject: str, html_body: str, sender: Optional[EmailSender] = None
+) -> bool:
     """Send an HTML email.
 
     Args:
         to_email: Recipient email address
         subject: Email subject
         html_body: HTML content
+        sender: Optional open EmailSender to reuse; otherwise a connection
+                is opened for this email alone
 
     Returns:
         True if sent successfully, False otherwise
     """
-    if not all([SMTP_HOST, SMTP_USER, SMTP_PASSWORD, to_email]):
+    if sender is not None:
+        return sender.send(to_email, subject, html_body)
+
+    if not _smtp_configured() or not to_email:
         logger.warning("SMTP not configured or no recipient, skipping email")
         return False
 
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = subject
-    msg["From"] = SMTP_FROM
-    msg["To"] = to_email
-
-    # Add HTML content
-    html_part = MIMEText(html_body, "html")
-    msg.attach(html_part)
+    msg = _build_message(to_email, subject, html_body)
 
     try:
-        with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-            server.starttls()
-            server.login(SMTP_USER, SMTP_PASSWORD)
+        with _connect() as server:
             server.send_message(msg)
         logger.info(f"Sent email to {to_email}: {subject}")
         return True
@@ -65,6 +189,7 @@ def send_success_email(
     completed: int,
     slack_count: int = 0,
     gmail_count: int = 0,
+    sender: Optional[EmailSender] = None,
 ) -> bool:
     """Send success summary email after a successful run.
 
@@ -76,6 +201,7 @@ def send_success_email(
         completed: Number of todos auto-completed
         slack_count: Number of Slack messages scanned
         gmail_count: Number of Gmail threads scanned
+        sender: Optional open EmailSender to send through
 
     Returns:
         True if sent successfully, False otherwise
@@ -91,13 +217,14 @@ def send_success_email(
         notion_url=notion_url,
     )
 
-    return _send_email(user_email, subject, html_body)
+    return _send_email(user_email, subject, html_body, sender=sender)
 
 
 def send_error_email(
     user_email: str,
     user_name: str,
     error: str,
+    sender: Optional[EmailSender] = None,
 ) -> bool:
     """Send error notification when aggregator run fails.
 
@@ -105,6 +232,7 @@ def send_error_email(
         user_email: User's email address
         user_name: User's display name
         error: Error message
+        sender: Optional open EmailSender to send through
 
     Returns:
         True if sent successfully, False otherwise
@@ -117,7 +245,7 @@ def send_error_email(
         registration_url=registration_url,
     )
 
-    return _send_email(user_email, subject, html_body)
+    return _send_email(user_email, subject, html_body, sender=sender)
 
 
 def send_welcome_email(
@@ -126,6 +254,7 @@ def send_welcome_email(
     user_id: str,
     personal_token: str,
     notion_database_id: str,
+    sender: Optional[EmailSender] = None,
 ) -> bool:
     """Send welcome email with personal trigger URL.
 
@@ -135,6 +264,7 @@ def send_welcome_email(
         user_id: User's ID
         personal_token: User's personal trigger token
         notion_database_id: User's Notion database ID
+        sender: Optional open EmailSender to send through
 
     Returns:
         True if sent successfully, False otherwise
@@ -148,4 +278,4 @@ def send_welcome_email(
         notion_url=notion_url,
     )
 
-    return _send_email(user_email, subject, html_body)
+    return _send_email(user_email, subject, html_body, sender=sender)